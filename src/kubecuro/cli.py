@@ -9,16 +9,53 @@ error handling, and actionable summary recommendations.
 
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, BarColumn, TaskProgressColumn
-
-# Internal Package Imports
-from kubecuro.core.engine import AuditEngineV2
+from types import SimpleNamespace
+
+# Rich and the engine are imported lazily (see _rich / main) so that --help
+# and early error exits don't pay for loading them.
+
+@lru_cache(maxsize=None)
+def _rich() -> SimpleNamespace:
+    """Imports Rich on first use and returns the pieces the CLI renders with."""
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, BarColumn, TaskProgressColumn
+    return SimpleNamespace(
+        console=Console(), Table=Table, Panel=Panel, Progress=Progress,
+        SpinnerColumn=SpinnerColumn, TextColumn=TextColumn, TimeElapsedColumn=TimeElapsedColumn,
+        BarColumn=BarColumn, TaskProgressColumn=TaskProgressColumn
+    )
 
-console = Console()
+def _results_table(ui, show_header: bool):
+    """
+    One slice of the streamed results table: the header, or a single row.
+    Fixed column widths keep separately printed slices aligned.
+    """
+    table = ui.Table(box=None, show_header=show_header, header_style="bold magenta", expand=True)
+    table.add_column("File Path", style="cyan", ratio=1, overflow="fold")
+    table.add_column("Status", style="bold", width=24)
+    table.add_column("Success", justify="center", width=7)
+    table.add_column("Changes", justify="right", width=7)
+    return table
+
+def _add_report_row(table, r):
+    """Appends one Report to the results table with status styling."""
+    # Determine styling based on state
+    is_success = r.success
+    is_partial = r.partial_heal
+    
+    status_color = "green" if is_success else "yellow" if is_partial else "red"
+    success_icon = "✅" if is_success else "⚠️" if is_partial else "❌"
+    
+    table.add_row(
+        r.file_path,
+        f"[{status_color}]{r.status}[/{status_color}]",
+        success_icon,
+        str(r.lines_changed)
+    )
 
 def main():
     parser = argparse.ArgumentParser(
@@ -31,18 +68,29 @@ def main():
     parser.add_argument("--force", action="store_true", help="Force write even on partial heals")
     parser.add_argument("--ext", default=".yaml", help="File extension to scan")
     parser.add_argument("--depth", type=int, default=10, help="Maximum directory depth")
+    parser.add_argument("--no-cache", action="store_true", help="Re-audit every file, ignoring .kubecuro-cache.json")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for directory scans (default: CPU count)")
 
     args = parser.parse_args()
 
     # 1. Initialization & Path Validation
     workspace = Path(args.path).resolve()
     if not workspace.exists():
-        console.print(Panel(f"[bold red]Error:[/bold red] Path [white]'{workspace}'[/white] does not exist.", border_style="red"))
+        print(f"Error: Path '{workspace}' does not exist.", file=sys.stderr)
         sys.exit(1)
 
-    engine = AuditEngineV2(str(workspace))
+    # Internal Package Imports (deferred until the path is known to be valid)
+    from kubecuro.core.engine import AuditEngineV2
+
+    ui = _rich()
+    console = ui.console
+
+    # A single file is audited relative to its own directory
+    engine_root = workspace.parent if workspace.is_file() else workspace
+    # Rows only show statuses, so reports don't carry the healed content
+    engine = AuditEngineV2(str(engine_root), use_cache=not args.no_cache, keep_content=False)
     
-    console.print(Panel.fit(
+    console.print(ui.Panel.fit(
         "[bold cyan]KubeCuro v0.1.0[/bold cyan]\n"
         f"[dim]Scanning: {workspace}[/dim]\n"
         f"[dim]Mode: {'FIX (with backup)' if args.fix else 'DRY-RUN (read-only)'}[/dim]",
@@ -56,8 +104,8 @@ def main():
     if workspace.is_file():
         target_files = [workspace]
     else:
-        # Shallow scan just to count files for the progress bar total
-        target_files = list(workspace.rglob(f"*{args.ext}"))
+        # Same walk scan_directory uses, so both agree on depth and extension case
+        target_files = engine.find_manifests(args.ext, args.depth)
 
     # EDGE 2: ZERO FILES DETECTED
     if not target_files:
@@ -65,14 +113,27 @@ def main():
         console.print(f"[dim]Try running with: --ext .yml  or verify the path: {workspace}[/dim]")
         sys.exit(0)
 
-    # 3. Execution with Enhanced Progress Tracking
-    reports = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(bar_width=40),
-        TaskProgressColumn(),
-        TimeElapsedColumn(),
+    # 3. Results, streamed: the header now, then each row printed (above the
+    # progress bar) as its report arrives and dropped, so memory stays flat
+    console.print("\n[bold]Audit Results[/bold]")
+    console.print(_results_table(ui, show_header=True))
+
+    # Running summary counters instead of keeping every report around
+    counters = {}
+
+    def record(report):
+        row = _results_table(ui, show_header=False)
+        _add_report_row(row, report)
+        console.print(row)
+        engine.update_counters(counters, report)
+
+    # 4. Execution with Enhanced Progress Tracking
+    with ui.Progress(
+        ui.SpinnerColumn(),
+        ui.TextColumn("[progress.description]{task.description}"),
+        ui.BarColumn(bar_width=40),
+        ui.TaskProgressColumn(),
+        ui.TimeElapsedColumn(),
         console=console
     ) as progress:
         
@@ -80,58 +141,31 @@ def main():
         
         if workspace.is_file():
             # Process single file
-            report = engine.audit_and_heal_file(
-                workspace.name, 
+            report = engine.audit_and_heal_abs(
+                str(workspace), 
                 dry_run=not args.fix, 
                 force_write=args.force
             )
-            reports.append(report)
+            record(report)
             progress.update(task_id, advance=1)
         else:
-            # Process directory with per-file progress updates
-            # We use the internal engine scan but track progress here for UI fidelity
-            for file_path in target_files:
-                # Relative path calculation for the engine
-                rel_path = str(file_path.relative_to(workspace))
-                report = engine.audit_and_heal_file(
-                    rel_path,
-                    dry_run=not args.fix,
-                    force_write=args.force
-                )
-                reports.append(report)
-                progress.update(task_id, advance=1, description=f"Healed: {file_path.name}")
-
-    # 4. Results Table with EDGE 1: EMPTY REPORTS SAFETY
-    table = Table(title="Audit Results", show_lines=True, header_style="bold magenta")
-    table.add_column("File Path", style="cyan", no_wrap=False)
-    table.add_column("Status", style="bold")
-    table.add_column("Success", justify="center")
-    table.add_column("Changes", justify="right")
-
-    # Use 'reports or []' to prevent iteration over NoneType
-    for r in (reports or []):
-        # Determine styling based on state
-        is_success = r.get('success', False)
-        is_partial = r.get('partial_heal', False)
-        
-        status_color = "green" if is_success else "yellow" if is_partial else "red"
-        success_icon = "✅" if is_success else "⚠️" if is_partial else "❌"
-        
-        # Double-safe retrieval of lines_changed
-        inner_report = r.get('report') or {}
-        lines_changed = inner_report.get('lines_changed', 0) or 0
-        
-        table.add_row(
-            str(r.get('file_path', 'unknown')),
-            f"[{status_color}]{r.get('status', 'UNKNOWN')}[/{status_color}]",
-            success_icon,
-            str(lines_changed)
-        )
-
-    console.print(table)
+            # Process directory across worker processes; progress advances per finished file
+            # Walk results are already absolute paths under the workspace
+            for report in engine.audit_files_parallel(
+                target_files,
+                dry_run=not args.fix,
+                force_write=args.force,
+                workers=args.workers
+            ):
+                record(report)
+                progress.update(task_id, advance=1, description=f"Healed: {Path(report.file_path).name}")
+
+    # Dry runs are read-only: the cache file is only written by --fix runs
+    if args.fix:
+        engine.save_cache()
 
     # 5. Final Summary & Contextual Next Steps
-    summary = engine.generate_summary(reports)
+    summary = engine.finalize(counters)
     
     console.print(f"\n[bold white]Final Summary:[/bold white]")
     console.print(f" • Total Files Scanned: {summary['total_files']}")
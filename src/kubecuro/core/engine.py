@@ -1,19 +1,115 @@
 #!/usr/bin/env python3
+import errno
+import json
 import os
+import stat
 import shutil
+import tempfile
 import time
+from dataclasses import dataclass
+from functools import partial
+from importlib.metadata import PackageNotFoundError, version as _dist_version
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
-from pipeline import HealingPipeline  # Local import for your VM; change for GitHub
+from typing import Dict, Any, List, Optional, Callable, Iterator, Tuple
+from kubecuro.healing.pipeline import HealingPipeline, POOL_CONTEXT
+
+# Per-workspace record of files that were clean at a given (mtime, size)
+CACHE_FILENAME = ".kubecuro-cache.json"
+# Bumped when the cache layout or the meaning of an entry changes
+CACHE_FORMAT = 2
+
+try:
+    KUBECURO_VERSION = _dist_version("kubecuro")
+except PackageNotFoundError:
+    KUBECURO_VERSION = "unknown"
+
+# Engine-level (filesystem) failures, counted as system errors in summaries
+ERROR_STATUSES = frozenset({'FILE_NOT_FOUND', 'PERMISSION_DENIED', 'NO_WRITE_PERMISSION', 'SCAN_ERROR'})
+
+# Check permissions as the effective user where the platform supports it
+_ACCESS_EFFECTIVE_IDS = os.access in os.supports_effective_ids
+
+@dataclass
+class Report:
+    """
+    Per-file audit outcome returned by AuditEngineV2.
+    
+    Slotted rather than a nested dict, avoiding per-row dict overhead. content
+    and changes are the healed YAML and per-line diff: None when the file was
+    never healed (e.g. cached or unreadable) or the engine was built with
+    keep_content=False. Kept, they make a report as large as the file itself.
+    Use to_dict() at serialization boundaries.
+    """
+    __slots__ = ('file_path', 'status', 'success', 'partial_heal', 'lines_changed',
+                 'backup_created', 'written', 'error', 'backup_warning', 'write_error',
+                 'content', 'changes', 'file_size_bytes', 'file_mtime_ns')
+    file_path: str
+    status: str
+    success: bool
+    partial_heal: bool
+    lines_changed: int
+    backup_created: Optional[str]   # Backup path relative to the workspace
+    written: bool
+    error: Optional[str]            # Pipeline or pre-flight error
+    backup_warning: Optional[str]   # Backup copy failed (the write may still succeed)
+    write_error: Optional[str]      # Atomic write failed
+    content: Optional[str]
+    changes: Optional[List[Dict[str, Any]]]
+    file_size_bytes: int
+    file_mtime_ns: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# Per-worker engine for audit_files_parallel (set by _engine_worker_init in each process)
+_ENGINE = None
+
+
+def _engine_worker_init(workspace_path: str, use_cache: bool, keep_content: bool,
+                        max_size_mb: int, timeout_s: int):
+    """
+    Pool initializer: build one AuditEngineV2 (and its HealingPipeline) per
+    worker process, with the parent's limits, reused for every task.
+    """
+    global _ENGINE
+    pipeline = HealingPipeline(max_size_mb=max_size_mb, timeout_s=timeout_s)
+    _ENGINE = AuditEngineV2(workspace_path, use_cache=use_cache, keep_content=keep_content,
+                            pipeline=pipeline)
+
+
+def _audit_one(abs_path: str, dry_run: bool, force_write: bool) -> Report:
+    """Pool task: audit and heal a single file with the worker's engine."""
+    return _ENGINE.audit_and_heal_abs(abs_path, dry_run, force_write)
 
 class AuditEngineV2:
-    def __init__(self, workspace_path: str):
+    def __init__(self, workspace_path: str, use_cache: bool = False,
+                 keep_content: bool = True,
+                 pipeline: Optional[HealingPipeline] = None):
         """
         Principal Engineer Note: Workspace management with path validation.
+        
+        use_cache: Skip files recorded as clean in .kubecuro-cache.json whose
+        mtime and size are unchanged (off by default; the CLI turns it on).
+        Only fix runs add entries or write the file; entries from another
+        kubecuro version or pipeline configuration are ignored.
+        keep_content: Attach the healed YAML and per-line changes to each
+        Report. Callers that only need statuses (the CLI) turn it off, so
+        worker processes don't ship every file's content back to the parent.
+        pipeline: Pre-built HealingPipeline to use (default: a new one).
         """
         self.workspace = Path(workspace_path).resolve()
-        self.pipeline = HealingPipeline()
+        # Workspace as a string ending in a separator, for slicing relative paths
+        self._root_prefix = os.path.join(str(self.workspace), '')
+        self.pipeline = pipeline or HealingPipeline()
         self._ensure_workspace()
+        self.cache_path = self.workspace / CACHE_FILENAME
+        self._cache = self._load_cache() if use_cache else None
+        self._cache_dirty = False
+        self.keep_content = keep_content
+        # Backup bookkeeping: directory -> backup names, (directory, stem) -> last counter
+        self._backup_listing: Dict[str, List[str]] = {}
+        self._backup_counters: Dict[Tuple[str, str], int] = {}
 
     def _ensure_workspace(self):
         """Ensures the target directory exists before operations begin."""
@@ -21,7 +117,7 @@ class AuditEngineV2:
             self.workspace.mkdir(parents=True, exist_ok=True)
 
     def audit_and_heal_file(self, relative_path: str, dry_run: bool = True, 
-                            force_write: bool = False) -> Dict[str, Any]:
+                            force_write: bool = False) -> Report:
         """
         The Core Orchestrator: Validates, Heals, Backups, and Writes.
         
@@ -30,22 +126,46 @@ class AuditEngineV2:
             dry_run: If True, no files are changed.
             force_write: If True, writes even if only 'partial_heal' is achieved.
         """
-        full_path = (self.workspace / relative_path).resolve()
+        return self.audit_and_heal_abs(os.path.join(self._root_prefix, relative_path), dry_run, force_write)
+
+    def audit_and_heal_abs(self, abs_path: str, dry_run: bool = True, 
+                           force_write: bool = False) -> Report:
+        """
+        audit_and_heal_file for a path already joined onto the workspace (e.g.
+        straight from a directory walk). The relative form is only computed,
+        by slicing, for the report's file_path.
+        """
+        relative_path = abs_path[len(self._root_prefix):] if abs_path.startswith(self._root_prefix) else abs_path
         
-        # --- PHASE 1: PRE-FLIGHT VALIDATION ---
-        if not full_path.exists():
-            return self._file_error(relative_path, "FILE_NOT_FOUND", f"File not found: {full_path}")
+        # --- PHASE 1: PRE-FLIGHT VALIDATION (one stat, then os.access) ---
+        # No resolve(): the workspace root is resolved once in __init__, and the
+        # lstat below rejects symlinked files, so writes never follow a link.
+        try:
+            st = os.stat(abs_path, follow_symlinks=False)
+        except OSError as e:
+            if e.errno in (errno.ENOENT, errno.ENOTDIR):
+                return self._file_error(relative_path, "FILE_NOT_FOUND", f"File not found: {abs_path}")
+            if e.errno in (errno.EACCES, errno.EPERM):
+                return self._file_error(relative_path, "PERMISSION_DENIED", f"Read access denied: {abs_path}")
+            return self._file_error(relative_path, "SCAN_ERROR", str(e))
         
-        if not full_path.is_file():
-            return self._file_error(relative_path, "NOT_A_FILE", f"Not a regular file: {full_path}")
+        if not stat.S_ISREG(st.st_mode):
+            return self._file_error(relative_path, "NOT_A_FILE", f"Not a regular file: {abs_path}")
         
-        if not os.access(full_path, os.R_OK):
-            return self._file_error(relative_path, "PERMISSION_DENIED", f"Read access denied: {full_path}")
+        if not self._can_access(abs_path, os.R_OK):
+            return self._file_error(relative_path, "PERMISSION_DENIED", f"Read access denied: {abs_path}")
         
         # Check write access on the file and the directory before processing
         if not dry_run:
-            if not os.access(full_path, os.W_OK) or not os.access(full_path.parent, os.W_OK):
+            if not self._can_access(abs_path, os.W_OK) or not self._can_access(os.path.dirname(abs_path), os.W_OK):
                 return self._file_error(relative_path, "NO_WRITE_PERMISSION", "Write access denied")
+        
+        # Unchanged files that were clean last run need no further work. Checked
+        # after the mode and access checks: chmod leaves mtime and size alone.
+        if self._is_cached_clean(relative_path, st):
+            return self._cached_result(relative_path, st)
+
+        full_path = Path(abs_path)
 
         # --- PHASE 2: PROCESSING ---
         result = self.pipeline.heal_manifest(file_path=full_path)
@@ -54,118 +174,353 @@ class AuditEngineV2:
         should_write = not dry_run and (result['success'] or (result['partial_heal'] and force_write))
         
         # --- PHASE 3: BACKUP & ATOMIC WRITE ---
+        backup_created = None
+        backup_warning = None
+        write_error = None
+        written = False
         if should_write:
-            backup_path = self._create_unique_backup(full_path)
-            if backup_path:
-                try:
-                    shutil.copy2(full_path, backup_path)
-                    result["backup_created"] = str(backup_path.relative_to(self.workspace))
-                except Exception as e:
-                    result["backup_warning"] = f"Backup failed: {str(e)}"
+            try:
+                backup_path = self._create_unique_backup(full_path)
+                backup_created = str(backup_path.relative_to(self.workspace))
+            except Exception as e:
+                backup_warning = f"Backup failed: {str(e)}"
             
             try:
                 self._atomic_write(full_path, result['content'])
-                result["written"] = True
+                written = True
             except IOError as e:
-                result["write_error"] = str(e)
+                write_error = str(e)
                 result["success"] = False  # Downgrade to failure if disk write fails
         
         # Attach Metadata
-        result["file_path"] = str(relative_path)
         try:
-            result["file_size_bytes"] = full_path.stat().st_size
+            st = full_path.stat()
+            size, mtime_ns = st.st_size, st.st_mtime_ns
         except OSError:
-            result["file_size_bytes"] = 0
-            
-        return result
+            size, mtime_ns = 0, None
+        
+        report = Report(
+            file_path=relative_path,
+            status=result['status'],
+            success=result['success'],
+            partial_heal=bool(result['partial_heal']),
+            lines_changed=result['report'].get('lines_changed', 0),
+            backup_created=backup_created,
+            written=written,
+            error=result['report'].get('error'),
+            backup_warning=backup_warning,
+            write_error=write_error,
+            content=result['content'] if self.keep_content else None,
+            changes=result['report'].get('changes') if self.keep_content else None,
+            file_size_bytes=size,
+            file_mtime_ns=mtime_ns
+        )
+        self._remember(report, dry_run)
+        return report
+
+    def _can_access(self, path: str, mode: int) -> bool:
+        """
+        os.access() as the effective user where supported. Asks the kernel, so
+        read-only mounts, ACLs and capabilities are honoured; never cached, so
+        permission changes during a run are seen.
+        """
+        if _ACCESS_EFFECTIVE_IDS:
+            return os.access(path, mode, effective_ids=True)
+        return os.access(path, mode)
+
+    def _cache_header(self) -> Dict[str, Any]:
+        """What the cached verdicts depend on besides the file itself."""
+        return {
+            "format": CACHE_FORMAT,
+            "kubecuro": KUBECURO_VERSION,
+            "max_size_mb": self.pipeline.max_size_mb,
+            "timeout_s": self.pipeline.timeout_s
+        }
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Loads the clean-file cache; a missing, corrupt or stale (different
+        header) file means empty.
+        """
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('header') != self._cache_header():
+            return {}
+        files = data.get('files')
+        return files if isinstance(files, dict) else {}
+
+    def _is_cached_clean(self, relative_path: str, st: os.stat_result) -> bool:
+        """True if this file was clean last run and its mtime/size still match."""
+        if not self._cache:
+            return False
+        entry = self._cache.get(relative_path)
+        return (entry is not None and
+                entry.get('mtime_ns') == st.st_mtime_ns and
+                entry.get('size') == st.st_size)
+
+    def _cached_result(self, relative_path: str, st: os.stat_result) -> Report:
+        """Synthesized report for a cache hit: nothing to heal, nothing written."""
+        return Report(
+            file_path=relative_path, status="CACHED", success=True, partial_heal=False,
+            lines_changed=0, backup_created=None, written=False, error=None,
+            backup_warning=None, write_error=None, content=None, changes=None,
+            file_size_bytes=st.st_size, file_mtime_ns=st.st_mtime_ns
+        )
+
+    def _remember(self, report: Report, dry_run: bool):
+        """
+        Records files that are clean on disk after a fix run (valid and either
+        unchanged or just written); forgets everything else. Dry runs leave
+        the cache untouched, so they never create or rewrite the cache file.
+        """
+        if self._cache is None or dry_run or report.status == 'CACHED':
+            return
+        relative_path = report.file_path
+        is_clean = report.success and (report.written or not report.lines_changed)
+        if is_clean and report.file_mtime_ns is not None:
+            self._cache[relative_path] = {
+                "mtime_ns": report.file_mtime_ns,
+                "size": report.file_size_bytes,
+                "status": report.status
+            }
+            self._cache_dirty = True
+        elif self._cache.pop(relative_path, None) is not None:
+            self._cache_dirty = True
 
-    def _create_unique_backup(self, target_path: Path) -> Optional[Path]:
+    def save_cache(self):
+        """Persists the clean-file cache if this run changed it (best effort)."""
+        if self._cache is None or not self._cache_dirty or not self.workspace.is_dir():
+            return
+        try:
+            payload = {"header": self._cache_header(), "files": self._cache}
+            self._atomic_write(self.cache_path, json.dumps(payload, indent=0, sort_keys=True))
+            self._cache_dirty = False
+        except IOError:
+            pass
+
+    def audit_files_parallel(self, abs_paths: List[str], dry_run: bool = True,
+                             force_write: bool = False,
+                             workers: Optional[int] = None) -> Iterator[Report]:
         """
-        Generates a unique backup name: service.kubecuro.backup, 
+        Runs audit_and_heal_abs over many files in worker processes.
+        
+        Files are independent, so this is a plain Pool/Map. Reports are yielded
+        in completion order; each one carries its own file_path.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(abs_paths) <= 1:
+            for abs_path in abs_paths:
+                yield self.audit_and_heal_abs(abs_path, dry_run, force_write)
+            return
+
+        task = partial(_audit_one, dry_run=dry_run, force_write=force_write)
+        chunksize = max(1, len(abs_paths) // (workers * 4))
+        with POOL_CONTEXT.Pool(workers, initializer=_engine_worker_init,
+                                  initargs=(str(self.workspace), self._cache is not None, self.keep_content,
+                                            self.pipeline.max_size_mb, self.pipeline.timeout_s)) as pool:
+            for report in pool.imap_unordered(task, abs_paths, chunksize=chunksize):
+                # Workers hold their own cache copies; the parent's is the one saved
+                self._remember(report, dry_run)
+                yield report
+
+    def _create_unique_backup(self, target_path: Path) -> Path:
+        """
+        Copies target_path to a unique backup name: service.kubecuro.backup, 
         service-1.kubecuro.backup, etc.
+        
+        The highest existing counter per (directory, stem) is learned from one
+        os.scandir of the directory and cached, so repeat runs don't probe
+        every historical backup. The name is reserved with O_CREAT|O_EXCL,
+        which is the only collision check needed. If the copy fails the
+        reserved placeholder is removed and the error is raised.
         """
-        # Primary naming convention
-        backup_path = target_path.with_suffix('.kubecuro.backup')
+        parent = str(target_path.parent)
+        stem = target_path.stem
+        key = (parent, stem)
+        counter = self._backup_counters.get(key)
+        if counter is None:
+            counter = self._max_backup_counter(parent, stem)
         
-        # If exists, start incrementing a counter
-        if backup_path.exists():
-            counter = 1
-            while True:
-                new_name = f"{target_path.stem}-{counter}.kubecuro.backup"
-                backup_path = target_path.with_name(new_name)
-                if not backup_path.exists():
-                    break
-                counter += 1
+        while True:
+            counter += 1
+            # Counter 0 is the primary naming convention (no suffix number)
+            name = f"{stem}.kubecuro.backup" if counter == 0 else f"{stem}-{counter}.kubecuro.backup"
+            backup_path = target_path.with_name(name)
+            try:
+                fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                continue
+            os.close(fd)
+            self._backup_counters[key] = counter
+            try:
+                shutil.copy2(target_path, backup_path)
+            except BaseException:
+                # Don't leave an empty backup behind that looks like a real one
+                try:
+                    os.unlink(backup_path)
+                except OSError:
+                    pass
+                raise
+            return backup_path
+
+    def _max_backup_counter(self, parent: str, stem: str) -> int:
+        """
+        Highest backup counter for stem in parent: -1 if none, 0 for the
+        primary name, N for stem-N. The directory is listed once per engine.
+        """
+        names = self._backup_listing.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent) as entries:
+                    names = [e.name for e in entries if e.name.endswith('.kubecuro.backup')]
+            except OSError:
+                names = []
+            self._backup_listing[parent] = names
         
-        return backup_path
+        highest = -1
+        prefix = f"{stem}-"
+        for name in names:
+            base = name[:-len('.kubecuro.backup')]
+            if base == stem:
+                highest = max(highest, 0)
+            elif base.startswith(prefix) and base[len(prefix):].isdigit():
+                highest = max(highest, int(base[len(prefix):]))
+        return highest
 
     def _atomic_write(self, target_path: Path, content: str):
         """
-        Atomic Write Pattern: Write to temp -> Rename to target.
-        Ensures the file is never partially written or corrupted.
+        Atomic Write Pattern: Write to temp -> fsync -> Rename to target.
+        Ensures the file is never partially written or corrupted, and the
+        rename itself survives a crash (directory entry is fsync'ed too).
+        The temp name is unique per call: parallel workers may heal files
+        that share a stem (app.yaml, app.YAML) in the same directory.
         """
-        temp_file = target_path.with_suffix('.kubecuro.tmp')
+        data = content.encode('utf-8')  # One encode; no TextIOWrapper chunking
+        temp_file = None
         try:
-            temp_file.write_text(content, encoding='utf-8')
+            fd, temp_name = tempfile.mkstemp(dir=target_path.parent, prefix=target_path.name,
+                                             suffix='.kubecuro.tmp')
+            temp_file = Path(temp_name)
+            try:
+                # mkstemp creates 0600; keep the permissions healed files always had
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(fd, 0o644)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             # os.replace is atomic on Unix/Linux
             os.replace(temp_file, target_path)
+            self._fsync_dir(target_path.parent)
         except Exception as e:
-            if temp_file.exists():
+            if temp_file is not None and temp_file.exists():
                 temp_file.unlink()  # Cleanup the trash
             raise IOError(f"Atomic write failed: {str(e)}")
 
+    def _fsync_dir(self, directory: Path):
+        """Flushes a directory entry after a rename (POSIX only, best effort)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        try:
+            fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
     def scan_directory(self, extension: str = ".yaml", dry_run: bool = True, 
                        force_write: bool = False, max_depth: int = 10,
-                       progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+                       progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Report]:
         """
         Recursively scans the workspace for YAML files with depth protection.
         """
         reports = []
-        # Support both .yaml and .YAML
-        patterns = [f"*{extension.lower()}", f"*{extension.upper()}"]
         
-        # Pre-scan for total count to support progress bars
-        all_files = []
-        for p in patterns:
-            all_files.extend([f for f in self.workspace.rglob(p) if f.is_file() and not f.is_symlink()])
+        # Pre-scan for total count to support progress bars (depth pruned during the walk)
+        all_files = self.find_manifests(extension, max_depth)
         
         total_files = len(all_files)
         processed = 0
 
         for file_path in all_files:
-            # Depth check
-            try:
-                depth = len(file_path.relative_to(self.workspace).parts)
-                if depth > max_depth:
-                    continue
-            except ValueError:
-                continue
-
-            rel_path = str(file_path.relative_to(self.workspace))
-            report = self.audit_and_heal_file(rel_path, dry_run, force_write)
+            report = self.audit_and_heal_abs(file_path, dry_run, force_write)
             reports.append(report)
             
             processed += 1
             if progress_callback:
                 progress_callback(processed, total_files)
 
+        if not dry_run:
+            self.save_cache()
         return reports
 
-    def generate_summary(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def find_manifests(self, extension: str = ".yaml", max_depth: int = 10) -> List[str]:
+        """
+        Absolute paths of the manifests scan_directory would audit: extension
+        matched case-insensitively, files directly in the workspace at depth 1.
+        """
+        return [path for path, _depth in
+                self._walk_manifests(str(self.workspace), extension.lower(), max_depth)]
+
+    def _walk_manifests(self, root: str, extension: str, max_depth: Optional[int],
+                        depth: int = 1) -> Iterator[Tuple[str, int]]:
+        """
+        Single os.scandir DFS yielding (path, depth) for regular files whose
+        lower-cased name ends with extension (pass it lower-cased). Files directly in the
+        workspace are depth 1; directories past max_depth (None: no limit) are never opened.
+        Symlinks are skipped, matching the original is_symlink() guard.
+        """
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if max_depth is None or depth < max_depth:
+                            yield from self._walk_manifests(entry.path, extension, max_depth, depth + 1)
+                    elif entry.name.lower().endswith(extension) and entry.is_file(follow_symlinks=False):
+                        yield entry.path, depth
+        except OSError:
+            return
+
+    def generate_summary(self, reports: List[Report]) -> Dict[str, Any]:
         """
         Intelligent Summary: Calculates success rates and suggests force_write.
         """
-        if not reports:
+        counters: Dict[str, int] = {}
+        for r in reports or []:
+            self.update_counters(counters, r)
+        return self.finalize(counters)
+
+    def update_counters(self, counters: Dict[str, int], report: Report) -> Dict[str, int]:
+        """
+        Folds one report into running summary counters (start from {}), so
+        callers can summarize a scan without keeping every report.
+        """
+        counters['total'] = counters.get('total', 0) + 1
+        counters['successful'] = counters.get('successful', 0) + report.success
+        counters['partial'] = counters.get('partial', 0) + report.partial_heal
+        counters['backups'] = counters.get('backups', 0) + bool(report.backup_created)
+        counters['writes'] = counters.get('writes', 0) + report.written
+        counters['errors'] = counters.get('errors', 0) + (report.status in ERROR_STATUSES)
+        return counters
+
+    def finalize(self, counters: Dict[str, int]) -> Dict[str, Any]:
+        """Turns running counters from update_counters into the summary dict."""
+        total = counters.get('total', 0)
+        if not total:
             return self._empty_summary()
 
-        total = len(reports)
-        successful = sum(1 for r in reports if r.get('success', False))
-        partial = sum(1 for r in reports if r.get('partial_heal', False))
-        backups = sum(1 for r in reports if r.get('backup_created'))
-        writes = sum(1 for r in reports if r.get('written', False))
-        
-        error_count = sum(1 for r in reports if r.get('status') in 
-                          ['FILE_NOT_FOUND', 'PERMISSION_DENIED', 'NO_WRITE_PERMISSION', 'SCAN_ERROR'])
+        successful = counters['successful']
+        partial = counters['partial']
+        error_count = counters['errors']
 
         # Intelligent Logic: If partial heals are few (<10%), suggest force_write to the user
         recommend_force = (partial > 0) and (partial < (total * 0.10))
@@ -177,21 +532,20 @@ class AuditEngineV2:
             "partial_heal": partial,
             "failed_logic": total - successful - partial - error_count,
             "system_errors": error_count,
-            "backups_created": backups,
-            "written_to_disk": writes,
+            "backups_created": counters['backups'],
+            "written_to_disk": counters['writes'],
             "recommend_force_write": recommend_force,
             "summary_timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
 
-    def _file_error(self, relative_path: str, status: str, error: str) -> Dict[str, Any]:
+    def _file_error(self, relative_path: str, status: str, error: str) -> Report:
         """Internal helper for standardized error structure."""
-        return {
-            "file_path": relative_path,
-            "status": status,
-            "error": error,
-            "success": False,
-            "partial_heal": False
-        }
+        return Report(
+            file_path=str(relative_path), status=status, success=False, partial_heal=False,
+            lines_changed=0, backup_created=None, written=False, error=error,
+            backup_warning=None, write_error=None, content=None, changes=None,
+            file_size_bytes=0, file_mtime_ns=None
+        )
 
     def _empty_summary(self) -> Dict[str, Any]:
         return {
@@ -199,12 +553,15 @@ class AuditEngineV2:
             "partial_heal": 0, "system_errors": 0, "backups_created": 0
         }
 
-    def cleanup_backups(self, max_age_hours: int = 24) -> int:
-        """Removes old .kubecuro.backup files."""
+    def cleanup_backups(self, max_age_hours: int = 24, max_depth: Optional[int] = None) -> int:
+        """Removes old .kubecuro.backup files (the whole tree unless max_depth is given)."""
         count = 0
         cutoff = time.time() - (max_age_hours * 3600)
-        for backup in self.workspace.rglob("*.kubecuro.backup"):
-            if backup.stat().st_mtime < cutoff:
-                backup.unlink()
-                count += 1
+        for backup, _depth in self._walk_manifests(str(self.workspace), ".kubecuro.backup", max_depth):
+            try:
+                if os.stat(backup).st_mtime < cutoff:
+                    os.unlink(backup)
+                    count += 1
+            except OSError:
+                continue
         return count
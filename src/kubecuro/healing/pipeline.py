@@ -5,12 +5,71 @@ KUBECURO PIPELINE - Phase 1.3 (Production Hardened)
 Orchestrates the flow: Raw Text -> Lexer -> Structurer -> Validated YAML.
 All production edges covered: memory, partial heal, file input, BOM, etc.
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+import asyncio
+import errno
+import multiprocessing
+import os
 import sys
 from kubecuro.healing.lexer import RawLexer
 from kubecuro.healing.structurer import KubeStructurer
 
+# Optional: io_uring-backed reads (Linux 5.6+). heal_files_async falls back to threads without it.
+try:
+    import aio_uring
+except ImportError:
+    aio_uring = None
+
+# Structurer statuses that mean the output is kubectl-apply ready
+SUCCESS_STATUSES = frozenset({
+    "STRUCTURE_OK",
+    "STRUCTURE_FIXED_1",
+    "STRUCTURE_FIXED_2",
+    "STRUCTURE_FIXED_3",
+    "MULTI_DOC_HANDLED"
+})
+
+# Start method for worker pools (heal_files_parallel, AuditEngineV2.audit_files_parallel).
+# Callers may have live threads (e.g. a Rich Progress refresh thread) that a
+# plain fork would copy mid-write; forkserver starts workers from a clean
+# single-threaded server instead. Platforms without it keep their default.
+POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None)
+
+# Per-worker pipeline for heal_files_parallel (set by _worker_init in each process)
+_PIPELINE = None
+
+
+def _worker_init(max_size_mb: int, timeout_s: int):
+    """
+    Pool initializer: build one HealingPipeline per worker process, configured
+    like the parent's, and reuse it for every file that worker handles.
+    """
+    global _PIPELINE
+    _PIPELINE = HealingPipeline(max_size_mb=max_size_mb, timeout_s=timeout_s)
+
+
+def _heal_one(file_path: Path) -> Tuple[Path, Dict[str, Any]]:
+    """Pool task: heal a single file with the worker's pipeline."""
+    return file_path, _PIPELINE.heal_manifest(file_path=file_path)
+
+
+class _FileTooLarge(Exception):
+    """Raised by HealingPipeline._read when the on-disk size exceeds the limit."""
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.size = size
+
+
+def _is_uring_unsupported(outcome: Any) -> bool:
+    """True when a read failed because io_uring itself is unavailable."""
+    if isinstance(outcome, NotImplementedError):
+        return True
+    return isinstance(outcome, OSError) and outcome.errno in (errno.ENOSYS, errno.EPERM)
+
 
 class HealingPipeline:
     def __init__(self, max_size_mb: int = 10, timeout_s: int = 30):
@@ -40,18 +99,54 @@ class HealingPipeline:
         # EDGE 2: Read from file if provided (BOM stripping)
         if file_path:
             try:
-                raw_content = file_path.read_text(encoding='utf-8-sig')
+                raw_bytes = self._read(file_path)
+            except _FileTooLarge as e:
+                return self._too_large("", e.size)
             except Exception as e:
                 return self._error_response("", f"FILE_READ_ERROR: {str(e)}", str(e), file_path)
+            return self._heal_bytes(raw_bytes, file_path)
         
-        # EDGE 3: MEMORY FIX - UTF-8 bytes (not sys.getsizeof)
-        content_bytes = len(raw_content.encode('utf-8'))
+        return self._heal_str(raw_content, file_path)
+
+    def _read(self, file_path: Path) -> bytes:
+        """
+        Blocking file read (releases the GIL, so safe to fan out on threads).
+        Oversized files are rejected from fstat before any byte is read.
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > self.max_size_mb * 1024 * 1024:
+                raise _FileTooLarge(size)
+            return f.read()
+
+    def _heal_bytes(self, raw_bytes: bytes, file_path: Path) -> Dict[str, Any]:
+        """
+        Size-checks file bytes before decoding them (UTF-8, BOM stripped).
+        """
+        # EDGE 3: MEMORY FIX - size limit on the bytes actually read (the file may grow after fstat)
+        content_bytes = len(raw_bytes)
         if content_bytes > self.max_size_mb * 1024 * 1024:
-            return self._error_response(
-                raw_content[:1000], 
-                "FILE_TOO_LARGE", 
-                f"File exceeds {self.max_size_mb}MB limit ({content_bytes/1024/1024:.1f}MB)"
-            )
+            return self._too_large(raw_bytes[:1000].decode('utf-8-sig', errors='ignore'), content_bytes)
+        
+        try:
+            raw_content = raw_bytes.decode('utf-8-sig')
+        except UnicodeDecodeError as e:
+            return self._error_response("", f"FILE_READ_ERROR: {str(e)}", str(e), file_path)
+        
+        return self._heal_str(raw_content, file_path, content_bytes)
+
+    def _heal_str(self, raw_content: str, file_path: Optional[Path] = None,
+                  content_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """
+        CPU-bound half of heal_manifest: size/empty checks, lexer, structurer.
+        """
+        # EDGE 3: MEMORY FIX - UTF-8 bytes (not sys.getsizeof)
+        if content_bytes is None:
+            # ASCII is one byte per char; only re-encode strings that aren't
+            content_bytes = (len(raw_content) if raw_content.isascii()
+                             else len(raw_content.encode('utf-8', errors='surrogatepass')))
+            if content_bytes > self.max_size_mb * 1024 * 1024:
+                return self._too_large(raw_content[:1000], content_bytes)
         
         # EDGE 4: Empty/whitespace
         if not raw_content or not raw_content.strip():
@@ -68,14 +163,7 @@ class HealingPipeline:
             report = self.structurer.full_healing_report(raw_content, final_yaml, status)
             
             # CRITICAL: PARTIAL HEAL LOGIC
-            success_statuses = {
-                "STRUCTURE_OK", 
-                "STRUCTURE_FIXED_1", 
-                "STRUCTURE_FIXED_2", 
-                "STRUCTURE_FIXED_3", 
-                "MULTI_DOC_HANDLED"
-            }
-            is_structural_success = status in success_statuses
+            is_structural_success = status in SUCCESS_STATUSES
             is_partially_healed = (
                 status.startswith("STRUCTURE_FAIL") and 
                 final_yaml != lexed_content and 
@@ -94,7 +182,17 @@ class HealingPipeline:
             }
             
         except Exception as e:
-            return self._error_response(raw_content, f"PIPELINE_ERROR: {str(e)[:100]}", str(e))
+            return self._error_response(raw_content, f"PIPELINE_ERROR: {str(e)[:100]}", str(e),
+                                        content_bytes=content_bytes)
+
+    def _too_large(self, preview: str, content_bytes: int) -> Dict[str, Any]:
+        """FILE_TOO_LARGE response carrying only a preview of the content."""
+        return self._error_response(
+            preview, 
+            "FILE_TOO_LARGE", 
+            f"File exceeds {self.max_size_mb}MB limit ({content_bytes/1024/1024:.1f}MB)",
+            content_bytes=content_bytes
+        )
 
     def heal_manifests(self, contents: List[str]) -> List[Dict[str, Any]]:
         """
@@ -112,6 +210,108 @@ class HealingPipeline:
         """
         return [self.heal_manifest(file_path=fp) for fp in file_paths]
 
+    def heal_files_threaded(self, file_paths: List[Path],
+                            max_workers: int = 32) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """
+        Batch process files with reads overlapped on a thread pool.
+        
+        File reads release the GIL, so they run concurrently; healing of each
+        completed read happens on the calling thread. At most 2 * max_workers
+        reads are in flight or buffered at once, refilled as results are
+        consumed, so memory stays bounded for any number of files. Yields
+        (file_path, result) pairs in completion order.
+        """
+        window = 2 * max_workers
+        paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._read, fp): fp for fp in islice(paths, window)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fp = pending.pop(future)
+                    # Refill before healing so the pool keeps reading meanwhile
+                    for next_fp in islice(paths, 1):
+                        pending[executor.submit(self._read, next_fp)] = next_fp
+                    yield fp, self._read_result(future, fp)
+
+    def _read_result(self, future, fp: Path) -> Dict[str, Any]:
+        """Heals one finished _read future, mapping read failures to error responses."""
+        try:
+            raw_bytes = future.result()
+        except _FileTooLarge as e:
+            return self._too_large("", e.size)
+        except Exception as e:
+            return self._error_response("", f"FILE_READ_ERROR: {str(e)}", str(e), fp)
+        return self._heal_bytes(raw_bytes, fp)
+
+    async def heal_files_async(self, file_paths: List[Path],
+                               max_in_flight: int = 64) -> List[Tuple[Path, Dict[str, Any]]]:
+        """
+        Batch process files with reads submitted through io_uring.
+        
+        Requires Linux and the optional aio_uring package; otherwise (or when
+        the kernel lacks io_uring) the batch runs through heal_files_threaded.
+        At most max_in_flight files are open at once, oversized files are
+        rejected from stat before any byte is read, and each file is healed
+        as soon as its read completes, so raw bytes never pile up.
+        Returns (file_path, result) pairs in input order.
+        """
+        if aio_uring is None or sys.platform != 'linux':
+            return await self._heal_files_threaded_async(file_paths, max_in_flight)
+        
+        limit = asyncio.Semaphore(max_in_flight)
+        max_bytes = self.max_size_mb * 1024 * 1024
+        
+        async def _one(fp: Path) -> Dict[str, Any]:
+            async with limit:
+                size = os.stat(fp).st_size
+                if size > max_bytes:
+                    return self._too_large("", size)
+                async with aio_uring.open(str(fp), 'rb') as f:
+                    data = await f.read(-1)
+            return self._heal_bytes(data, fp)
+        
+        outcomes = await asyncio.gather(*[_one(fp) for fp in file_paths], return_exceptions=True)
+        if any(_is_uring_unsupported(o) for o in outcomes):
+            return await self._heal_files_threaded_async(file_paths, max_in_flight)
+        
+        results = []
+        for fp, outcome in zip(file_paths, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = self._error_response("", f"FILE_READ_ERROR: {str(outcome)}", str(outcome), fp)
+            results.append((fp, outcome))
+        return results
+
+    async def _heal_files_threaded_async(self, file_paths: List[Path],
+                                         max_in_flight: int) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Runs heal_files_threaded off the event loop, restoring input order."""
+        loop = asyncio.get_running_loop()
+        # heal_files_threaded keeps 2 * max_workers reads in flight
+        max_workers = max(1, max_in_flight // 2)
+        done = dict(await loop.run_in_executor(
+            None, lambda: list(self.heal_files_threaded(file_paths, max_workers=max_workers))))
+        return [(fp, done[fp]) for fp in file_paths]
+
+    def heal_files_parallel(self, file_paths: List[Path],
+                            workers: Optional[int] = None) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """
+        Batch process files across worker processes (Pool/Map pattern).
+        
+        Yields (file_path, result) pairs in completion order, so callers can
+        drive progress bars as results arrive. Falls back to in-process
+        healing when there is only one worker or one file.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(file_paths) <= 1:
+            for fp in file_paths:
+                yield fp, self.heal_manifest(file_path=fp)
+            return
+        
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with POOL_CONTEXT.Pool(workers, initializer=_worker_init,
+                                  initargs=(self.max_size_mb, self.timeout_s)) as pool:
+            yield from pool.imap_unordered(_heal_one, file_paths, chunksize=chunksize)
+
     def batch_success_rate(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Enhanced success metrics for SRE dashboards.
@@ -121,8 +321,13 @@ class HealingPipeline:
         if not results:
             return {"success_rate": 0.0, "total": 0, "successful": 0, "partial": 0, "failed": 0}
         
-        successful = sum(1 for r in results if r.get("success", False))
-        partial = sum(1 for r in results if r.get("partial_heal", False))
+        # Single pass accumulating both counters
+        successful = partial = 0
+        for r in results:
+            if r.get("success", False):
+                successful += 1
+            if r.get("partial_heal", False):
+                partial += 1
         total = len(results)
         
         return {
@@ -142,12 +347,21 @@ class HealingPipeline:
         return result.get("success", False)
 
     def _error_response(self, content: str, status: str, error: str, 
-                       file_path: Optional[Path] = None) -> Dict[str, Any]:
+                       file_path: Optional[Path] = None,
+                       content_bytes: Optional[int] = None) -> Dict[str, Any]:
         """
         Standardized error response format for all failure modes.
+        
+        Pass content_bytes when the caller already measured the input, so it
+        isn't re-encoded here.
         """
-        content_bytes = len(content.encode('utf-8')) if content else 0
-        lines = len(content.splitlines()) if content else 0
+        if not content:
+            lines = 0
+            content_bytes = content_bytes or 0
+        else:
+            lines = len(content.splitlines())
+            if content_bytes is None:
+                content_bytes = len(content.encode('utf-8', errors='surrogatepass'))
         
         return {
             "content": content,
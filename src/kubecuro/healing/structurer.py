@@ -1,8 +1,12 @@
 import io
 import re
 import sys
+import threading
+from collections import OrderedDict
+from itertools import compress, count
+from operator import ne
 import argparse
-from typing import Tuple, Union, List, Dict, Any
+from typing import Tuple, Union, List, Dict, Any, Optional, NamedTuple
 from pathlib import Path
 
 # External Dependencies
@@ -31,38 +35,207 @@ KUBERNETES HIERARCHY: spec(0)→containers(2)→-name(2)→image(4)
 PIPELINE: lexer.py → structurer.py → ruamel roundtrip
 """
 
+# Hot-path patterns, compiled once at import
+_COMMENT_SPLIT_RE = re.compile(r'\s+#')
+# Document boundary: a newline followed by '---' (split at the newline)
+_DOC_SEP = '\n---'
+
+# First character allowed after & / * for a line to count as an anchor or alias
+_ANCHOR_NAME_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-')
+
+# Line prefixes that _is_protected_structure leaves untouched
+_DIRECTIVE_PREFIXES = ('%YAML', '%TAG', '---', '...')
+_BLOCK_SCALAR_PREFIXES = ('|', '>')
+
+
+def _indent_width(line: str) -> int:
+    """Number of leading whitespace characters on line."""
+    # lstrip() is kept deliberately: for manifest-length lines its C copy beats
+    # both a per-character Python loop and re.match(r'\s*').end(), and it
+    # returns line itself (no copy) when there is no indent.
+    return len(line) - len(line.lstrip())
+
+
+def _rebuild_line(stripped: str, indent: int) -> str:
+    """Re-indents an already stripped line; blank lines stay empty."""
+    return ' ' * indent + stripped if stripped else ''
+
+
+class StructureError(NamedTuple):
+    """
+    Failed validate_and_roundtrip result. line/column are 0-based (-1 when
+    ruamel gave no mark); the exception text is only rendered by str(),
+    which keeps the STRUCTURE_ERROR:L<n>:C<n>:<message> format.
+    """
+    line: int
+    column: int
+    exc: YAMLError
+
+    @property
+    def message(self) -> str:
+        return str(self.exc)
+
+    def __str__(self) -> str:
+        if self.line < 0:
+            return f"STRUCTURE_ERROR:{self.exc}"
+        return f"STRUCTURE_ERROR:L{self.line + 1}:C{self.column + 1}:{self.exc}"
+
+
+def _structure_error(e: Exception) -> StructureError:
+    """StructureError at the exception's problem (or context) mark."""
+    mark = getattr(e, 'problem_mark', getattr(e, 'context_mark', None))
+    # Drop the traceback so cached errors don't pin parser frames
+    e.__traceback__ = None
+    if mark:
+        return StructureError(mark.line, mark.column, e)
+    return StructureError(-1, -1, e)
+
+
+class _ValidationCache:
+    """
+    Per-structurer LRU of validate_and_roundtrip results, keyed by the exact
+    YAML text plus the ruamel %YAML version it was loaded under (a directive
+    in one document changes how later ones are emitted). Bounded by total
+    characters held, not entry count; documents over max_entry_chars are
+    never stored. hits/misses are kept for profiling.
+    """
+
+    def __init__(self, max_chars: int = 4_000_000, max_entry_chars: int = 500_000):
+        self.max_chars = max_chars
+        self.max_entry_chars = max_entry_chars
+        self.hits = 0
+        self.misses = 0
+        self._chars = 0
+        # key -> (result, ruamel version after the load, characters held)
+        self._data: "OrderedDict[Tuple[Any, str], Tuple[Tuple[bool, Union[str, StructureError]], Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, str]) -> Optional[Tuple[Tuple[bool, Union[str, StructureError]], Any]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, key: Tuple[Any, str], result: Tuple[bool, Union[str, StructureError]],
+            version_after: Any) -> None:
+        text = key[1]
+        if len(text) > self.max_entry_chars:
+            return
+        # A failure's mark keeps ruamel's copy of the input alive
+        valid, payload = result
+        size = len(text) + (len(payload) if valid else len(text))
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._chars -= old[2]
+            self._data[key] = (result, version_after, size)
+            self._chars += size
+            while self._chars > self.max_chars and self._data:
+                self._chars -= self._data.popitem(last=False)[1][2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._chars = 0
+            self.hits = self.misses = 0
+
+
+class _LineEndingReader:
+    """
+    Read-only file-like wrapper that yields exactly the text process_yaml
+    parses: CRLF/CR become LF chunk by chunk, and trailing whitespace is held
+    back and dropped at EOF (the streaming form of _normalize_line_endings).
+    It notes whether a '\n---' document boundary went past. With keep=True
+    the emitted chunks are retained for sources that cannot be re-read.
+    """
+
+    def __init__(self, reader: Any, keep: bool):
+        self._reader = reader
+        self._held = ''
+        self._last = ''  # Last 3 chars emitted, to spot '\n---' across chunks
+        self.saw_doc_sep = False
+        self.chunks: Optional[List[str]] = [] if keep else None
+
+    def read(self, size: int = -1) -> str:
+        while True:
+            chunk = self._reader.read(size)
+            # A CR at the end of a chunk may be the first half of a CRLF
+            while chunk.endswith('\r'):
+                more = self._reader.read(1)
+                if not more:
+                    break
+                chunk += more
+            if not chunk:
+                return ''  # EOF: held trailing whitespace is never emitted
+            if '\r' in chunk:
+                chunk = chunk.replace('\r\n', '\n').replace('\r', '\n')
+            data = self._held + chunk
+            out = data.rstrip()
+            self._held = data[len(out):]
+            if out:
+                break
+        window = self._last + out
+        if _DOC_SEP in window:
+            self.saw_doc_sep = True
+        self._last = window[-3:]
+        if self.chunks is not None:
+            self.chunks.append(out)
+        return out
+
+    def drain(self) -> None:
+        """Reads whatever the parser left unread."""
+        while self.read(65536):
+            pass
+
 class KubeStructurer:
     def __init__(self):
         self.yaml = YAML()
         self.yaml.preserve_quotes = True
         self.yaml.indent(mapping=2, sequence=4, offset=2)
         self.yaml.width = 4096
+        # Reused dump buffer for validate_and_roundtrip (rewound, not reallocated)
+        self._buf = io.StringIO()
+        # Results of validate_and_roundtrip on this instance's self.yaml
+        self._validate_cache = _ValidationCache()
 
     def _normalize_line_endings(self, yaml_str: str) -> str:
         """FIX 1+4: CRLF, LF, CR → Unix LF (all platforms)."""
-        return yaml_str.replace('\r\n', '\n').replace('\r', '\n').rstrip()
+        # LF-only input (the common case) is detected with one C scan and
+        # never copied. splitlines() is not used: it also breaks on \x0b,
+        # \x0c, \x85 and U+2028/2029, which may appear inside YAML scalars.
+        if '\r' in yaml_str:
+            yaml_str = yaml_str.replace('\r\n', '\n').replace('\r', '\n')
+        return yaml_str.rstrip()
 
-    def _is_anchor_or_alias(self, line: str) -> bool:
-        """FIX 3: Detect &anchor and *alias lines - preserve exactly."""
-        content = line.strip()
-        return bool(re.match(r'^[ \t]*[&*][a-zA-Z0-9_-]+', content))
+    def _is_anchor_or_alias(self, stripped: str) -> bool:
+        """FIX 3: Detect &anchor and *alias lines - preserve exactly. Takes line.strip()."""
+        return stripped[:1] in ('&', '*') and stripped[1:2] in _ANCHOR_NAME_CHARS
 
-    def _is_protected_structure(self, line: str) -> bool:
-        """Protect YAML directives, anchors, block scalars from indent changes."""
-        content = line.strip()
-        return (content.startswith(('%YAML', '%TAG', '---', '...')) or 
-                self._is_anchor_or_alias(line) or
-                content.startswith(('|', '>')))
+    def _is_protected_structure(self, stripped: str) -> bool:
+        """Protect YAML directives, anchors, block scalars from indent changes. Takes line.strip()."""
+        return (stripped.startswith(_DIRECTIVE_PREFIXES) or 
+                self._is_anchor_or_alias(stripped) or
+                stripped.startswith(_BLOCK_SCALAR_PREFIXES))
 
-    def _extract_line(self, error_info: str) -> int:
+    def _extract_line(self, error_info: Union[str, StructureError]) -> int:
         """Parse ruamel.yaml error location from STRUCTURE_ERROR:L5:C3 format."""
-        if not error_info.startswith("STRUCTURE_ERROR:L"):
+        if isinstance(error_info, StructureError):
+            return error_info.line
+        prefix = "STRUCTURE_ERROR:L"
+        if not error_info.startswith(prefix):
             return -1
+        # Only the digits up to the next ':' are needed; the message is never split
+        end = error_info.find(':', len(prefix))
+        if end == -1:
+            end = len(error_info)
         try:
-            line_part = error_info.split(':')[1]  # L5
-            line_num_1based = int(line_part[1:])
+            line_num_1based = int(error_info[len(prefix):end])  # 5 of L5
             return line_num_1based - 1
-        except (IndexError, ValueError, AttributeError):
+        except ValueError:
             return -1
 
     def _find_parent_indent(self, lines: List[str], err_line: int) -> int:
@@ -70,90 +243,139 @@ class KubeStructurer:
         FIX 5: Skip empty lines + comments + protected structures.
         Finds closest mapping key above error line.
         """
+        if err_line <= 0:
+            return 0
         for i in range(err_line - 1, -1, -1):
-            if i < 0:
-                break
+            line = lines[i]
             
-            # 1. Split to remove comments
-            raw_content = re.split(r'\s+#', lines[i])[0].rstrip()
+            # 1. Split to remove comments (the regex only runs when there can be one)
+            if '#' in line:
+                line = _COMMENT_SPLIT_RE.split(line, maxsplit=1)[0]
+            raw_content = line.rstrip()
             
-            # 2. NOW check if the remaining content is empty or protected
-            # This ensures we skip lines that were ONLY comments
-            if (not raw_content.strip() or 
-                raw_content.strip().startswith('#') or 
-                self._is_protected_structure(raw_content)):
+            # 2. Only a key (ends with :) can be the parent; test that first so
+            # values, list items and blank lines are rejected without more work
+            if not raw_content.endswith(':'):
                 continue
-                
+            
+            # Already right-stripped, so lstrip() is the fully stripped form
             content = raw_content.lstrip()
-            # If it's a key (ends with :) and not a list item
-            if raw_content.endswith(':') and not content.startswith('- '):
-                return len(raw_content) - len(content)
+            
+            # 3. Skip lines that were ONLY comments, protected structures and list items
+            if (content.startswith('#') or 
+                content.startswith('- ') or 
+                self._is_protected_structure(content)):
+                continue
+                
+            return len(raw_content) - len(content)
         return 0
 
-    def _process_single_doc(self, yaml_str: str) -> Tuple[str, str]:
-        """Process single YAML document with iterative fixing."""
+    def _process_single_doc(self, yaml_str: str,
+                            error_info: Optional[Union[str, StructureError]] = None) -> Tuple[str, str]:
+        """
+        Process single YAML document with iterative fixing.
+        error_info: validation error already known for yaml_str (skips step 1).
+        """
         # Step 1: Initial validation
-        valid, result = self.validate_and_roundtrip(yaml_str)
-        if valid:
-            return result, "STRUCTURE_OK"
+        if error_info is None:
+            valid, result = self.validate_and_roundtrip(yaml_str)
+            if valid:
+                return result, "STRUCTURE_OK"
+        else:
+            result = error_info
 
         # FIX 6: Iterative multi-error fixing (max 3 attempts)
+        # Split once; fixes edit the line list in place and it is only joined for validation
+        lines = yaml_str.splitlines()
         current_yaml = yaml_str
+        # Parent indents by error line, valid while the lines above are unedited
+        parent_cache: Dict[int, int] = {}
         for attempt in range(3):
-            fixed_yaml = self.auto_fix_indentation(current_yaml, result)
+            # Parse the error location once per attempt; fix and check share it
+            err_line = self._extract_line(result)
+            self._fix_line(lines, err_line, parent_cache)
             
             # FIX 7: Skip protected structures (anchors, directives)
-            if self._is_protected_structure(fixed_yaml.splitlines()[self._extract_line(result)]):
+            # (protected lines are never edited, so current_yaml still matches lines)
+            if self._is_protected_structure(lines[err_line].strip()):
                 return current_yaml, "STRUCTURE_PROTECTED_SKIP"
             
-            valid2, result2 = self.validate_and_roundtrip(fixed_yaml)
+            current_yaml = '\n'.join(lines)
+            valid2, result2 = self.validate_and_roundtrip(current_yaml)
             if valid2:
                 return result2, f"STRUCTURE_FIXED_{attempt+1}"
             
-            current_yaml = fixed_yaml
             result = result2  # Chain errors
         
         return current_yaml, "STRUCTURE_FAIL"
 
     def _process_multi_doc(self, yaml_str: str) -> str:
         """FIX 2: Process each --- document separately."""
-        documents = re.split(r'\n(?=---)', yaml_str.strip())
-        fixed_docs = []
+        text = yaml_str.strip()
+        out: List[str] = []
         
-        for doc in documents:
+        def emit(doc: str) -> None:
             if doc.strip():
                 fixed_doc, status = self._process_single_doc(doc)
-                fixed_docs.append(fixed_doc)
+                if out:
+                    out.append('\n---\n')
+                out.append(fixed_doc)
+        
+        # Walk the split points instead of materialising every document up front;
+        # only the document being fixed and the output pieces are alive at once
+        start = 0
+        sep = text.find(_DOC_SEP)
+        while sep != -1:
+            emit(text[start:sep])
+            start = sep + 1
+            sep = text.find(_DOC_SEP, start)
+        emit(text[start:])
         
-        return '\n---\n'.join(fixed_docs)
+        return ''.join(out)
 
-    def auto_fix_indentation(self, yaml_str: str, error_info: str) -> str:
+    def auto_fix_indentation(self, lines: List[str], error_info: Union[str, StructureError]) -> List[str]:
         """
         FIX 7+8: INDUSTRIAL INDENT NORMALIZATION for ALL space counts.
         UNIFIED RELATIVE INDENT RULE + Tab/space mix handling.
+        
+        Fixes the error line of the document in place and returns the same list.
+        """
+        self._fix_line(lines, self._extract_line(error_info))
+        return lines
+
+    def _fix_line(self, lines: List[str], err_line: int,
+                  parent_cache: Optional[Dict[int, int]] = None) -> None:
+        """
+        Re-indents lines[err_line] in place (auto_fix_indentation on a parsed line number).
+        parent_cache memoizes _find_parent_indent across attempts on the same lines.
         """
-        err_line = self._extract_line(error_info)
         if err_line == -1:
-            return yaml_str
+            return
 
-        lines = yaml_str.splitlines()
         if err_line >= len(lines):
-            return yaml_str
+            return
 
         target_line = lines[err_line]
         
         # FIX 8: Tab+space mix - normalize to spaces only
         target_line = target_line.replace('\t', '  ')
         
+        stripped = target_line.strip()
+        
         # FIX 3+7: Skip protected structures entirely
-        if self._is_protected_structure(target_line):
-            return yaml_str
+        if self._is_protected_structure(stripped):
+            return
 
-        current_indent = len(target_line) - len(target_line.lstrip())
-        parent_indent = self._find_parent_indent(lines, err_line)
+        current_indent = _indent_width(target_line)
+        if parent_cache is None:
+            parent_indent = self._find_parent_indent(lines, err_line)
+        else:
+            parent_indent = parent_cache.get(err_line)
+            if parent_indent is None:
+                parent_indent = parent_cache[err_line] = self._find_parent_indent(lines, err_line)
         
         # UNIFIED KUBERNETES HIERARCHY RULE
-        if target_line.strip().startswith('-'):
+        if stripped.startswith('-'):
             target_indent = parent_indent + 2 # Dash aligns with parent
         else:
             target_indent = parent_indent + 2  # Content under mappings
@@ -163,26 +385,40 @@ class KubeStructurer:
         if (current_indent != target_indent or 
             '\t' in target_line or 
             current_indent % 2 != 0):  # Odd indents always wrong
-            fixed_line = (' ' * target_indent + target_line.lstrip()).rstrip()
-            lines[err_line] = fixed_line
-            return '\n'.join(lines)
-        
-        return yaml_str
+            lines[err_line] = _rebuild_line(stripped, target_indent)
+            # Lookups below the edited line scanned its old text
+            if parent_cache:
+                for key in [k for k in parent_cache if k > err_line]:
+                    del parent_cache[key]
+
+    def validate_and_roundtrip(self, clean_yaml: str) -> Tuple[bool, Union[str, StructureError]]:
+        """Structural validation via ruamel.yaml roundtrip (LRU-cached on the text)."""
+        key = (self.yaml.version, clean_yaml)
+        cached = self._validate_cache.get(key)
+        if cached is not None:
+            result, version_after = cached
+            # Replay the load's side effect on the %YAML version
+            self.yaml.version = version_after
+            return result
+        result = self._roundtrip(clean_yaml)
+        self._validate_cache.put(key, result, self.yaml.version)
+        return result
 
-    def validate_and_roundtrip(self, clean_yaml: str) -> Tuple[bool, Union[str, str]]:
-        """Structural validation via ruamel.yaml roundtrip."""
+    def _roundtrip(self, clean_yaml: str) -> Tuple[bool, Union[str, StructureError]]:
+        """Uncached ruamel.yaml load + dump of clean_yaml."""
         try:
-            data = self.yaml.load(clean_yaml)
-            output_buffer = io.StringIO()
-            self.yaml.dump(data, output_buffer)
-            return True, output_buffer.getvalue().rstrip()
+            return True, self._emit(self.yaml.load(clean_yaml))
         except YAMLError as e:  # Catch ALL ruamel errors including DuplicateKeyError
-            mark = getattr(e, 'problem_mark', getattr(e, 'context_mark', None))
-            if mark:
-                line_num = mark.line + 1
-                col_num = mark.column + 1
-                return False, f"STRUCTURE_ERROR:L{line_num}:C{col_num}:{str(e)}"
-            return False, f"STRUCTURE_ERROR:{str(e)}"
+            return False, _structure_error(e)
+
+    def _emit(self, data: Any) -> str:
+        """Dumps loaded data through the reused buffer."""
+        buf = self._buf
+        buf.seek(0)
+        buf.truncate()
+        self.yaml.dump(data, buf)
+        # rstrip() only walks the trailing whitespace, in C
+        return buf.getvalue().rstrip()
 
     def process_yaml(self, lexer_output: str) -> Tuple[str, str]:
         """
@@ -198,12 +434,58 @@ class KubeStructurer:
         # FIX 1+4: Normalize line endings FIRST
         normalized = self._normalize_line_endings(lexer_output)
         
+        # Fast path: a single document that already validates (the common CI
+        # case) is emitted once, with no splitting or fix attempts
+        error_info = None
+        if _DOC_SEP not in normalized:
+            valid, result = self.validate_and_roundtrip(normalized)
+            if valid:
+                return result, "STRUCTURE_OK"
+            error_info = result
+        
         # FIX 2: Multi-document handling
         if '---' in normalized and normalized.strip().startswith('---'):
             result = self._process_multi_doc(normalized)
             return result, "MULTI_DOC_HANDLED"
         
-        return self._process_single_doc(normalized)
+        return self._process_single_doc(normalized, error_info)
+
+    def process_yaml_stream(self, reader: io.TextIOBase) -> Tuple[str, str]:
+        """
+        process_yaml for a text stream, with identical results. A clean single
+        document is parsed straight from the reader, so neither the normalized
+        copy nor ruamel's own copy of the whole input is built. Parse errors and
+        multiple documents fall back to process_yaml on the full text, re-read
+        via seek() when the reader supports it; otherwise the normalized chunks
+        are kept while parsing, which costs one copy of the input.
+        """
+        try:
+            start = reader.tell() if reader.seekable() else None
+        except (AttributeError, OSError, ValueError):
+            start = None
+        stream = _LineEndingReader(reader, keep=start is None)
+        try:
+            data = self.yaml.load(stream)
+        except YAMLError:
+            return self.process_yaml(self._reread(reader, stream, start))
+        
+        stream.drain()
+        if stream.saw_doc_sep:
+            return self.process_yaml(self._reread(reader, stream, start))
+        return self._emit(data), "STRUCTURE_OK"
+
+    def _reread(self, reader: io.TextIOBase, stream: _LineEndingReader, start: Any) -> str:
+        """Full input text for a process_yaml_stream fallback."""
+        if start is None:
+            stream.drain()
+            return ''.join(stream.chunks)
+        reader.seek(start)
+        parts = []
+        part = reader.read()
+        while part:
+            parts.append(part)
+            part = reader.read()
+        return ''.join(parts)
 
     def full_healing_report(self, original: str, final: str, status: str) -> Dict[str, Any]:
         """Production-grade healing summary."""
@@ -211,15 +493,17 @@ class KubeStructurer:
         final_lines = final.splitlines()
         changes = []
         
-        for i, (orig, fixed) in enumerate(zip(original_lines, final_lines)):
-            if orig != fixed:
-                changes.append({
-                    'line': i + 1,
-                    'original': orig,
-                    'fixed': fixed,
-                    'indent_original': len(orig) - len(orig.lstrip()),
-                    'indent_fixed': len(fixed) - len(fixed.lstrip())
-                })
+        # Line-by-line comparison runs in C (map/compress); Python only visits changed lines
+        for i in compress(count(), map(ne, original_lines, final_lines)):
+            orig = original_lines[i]
+            fixed = final_lines[i]
+            changes.append({
+                'line': i + 1,
+                'original': orig,
+                'fixed': fixed,
+                'indent_original': _indent_width(orig),
+                'indent_fixed': _indent_width(fixed)
+            })
         
         return {
             'status': status,
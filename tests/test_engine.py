@@ -0,0 +1,144 @@
+import os
+
+import pytest
+
+from kubecuro.core.engine import AuditEngineV2
+
+
+def test_scan_directory_respects_depth_and_case(tmp_path):
+    """Depth is pruned during the walk and extensions match case-insensitively."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.yaml").write_text("a: 1\n")
+    (tmp_path / "a" / "mid.YAML").write_text("b: 2\n")
+    (tmp_path / "a" / "b" / "deep.yaml").write_text("c: 3\n")
+    (tmp_path / "a" / "notes.txt").write_text("ignored\n")
+
+    engine = AuditEngineV2(str(tmp_path))
+
+    shallow = {r.file_path for r in engine.scan_directory(max_depth=2)}
+    assert shallow == {"top.yaml", "a/mid.YAML"}
+
+    everything = {r.file_path for r in engine.scan_directory()}
+    assert everything == {"top.yaml", "a/mid.YAML", "a/b/deep.yaml"}
+
+    # The CLI walks with find_manifests and audits through worker processes
+    found = engine.find_manifests(max_depth=2)
+    assert sorted(found) == sorted([str(tmp_path / "top.yaml"), str(tmp_path / "a" / "mid.YAML")])
+    parallel = {r.file_path for r in engine.audit_files_parallel(found, workers=2)}
+    assert parallel == shallow
+
+
+def test_clean_files_are_cached_until_modified(tmp_path):
+    """A file left clean by a fix run is skipped until its mtime/size change."""
+    manifest = tmp_path / "svc.yaml"
+    manifest.write_text("kind: Service\n")
+    cache_file = tmp_path / ".kubecuro-cache.json"
+
+    dry = AuditEngineV2(str(tmp_path), use_cache=True).scan_directory()
+    assert dry[0].status == "STRUCTURE_OK"
+    assert not cache_file.exists()
+
+    first = AuditEngineV2(str(tmp_path), use_cache=True).scan_directory(dry_run=False)
+    assert first[0].status == "STRUCTURE_OK"
+    assert cache_file.exists()
+
+    second = AuditEngineV2(str(tmp_path), use_cache=True).scan_directory()
+    assert second[0].status == "CACHED"
+    assert second[0].success is True
+
+    manifest.write_text("kind: Service\nmetadata: {}\n")
+    third = AuditEngineV2(str(tmp_path), use_cache=True).scan_directory()
+    assert third[0].status == "STRUCTURE_OK"
+
+    uncached = AuditEngineV2(str(tmp_path)).scan_directory()
+    assert uncached[0].status == "STRUCTURE_OK"
+
+
+def test_cached_file_still_gets_access_checks(tmp_path, monkeypatch):
+    """A cache hit doesn't hide a file that lost write access (chmod keeps mtime)."""
+    (tmp_path / "svc.yaml").write_text("kind: Service\n")
+    AuditEngineV2(str(tmp_path), use_cache=True).scan_directory(dry_run=False)
+
+    engine = AuditEngineV2(str(tmp_path), use_cache=True)
+    assert engine.scan_directory(dry_run=False)[0].status == "CACHED"
+    monkeypatch.setattr(engine, "_can_access", lambda path, mode: mode != os.W_OK)
+    assert engine.scan_directory(dry_run=False)[0].status == "NO_WRITE_PERMISSION"
+
+
+def test_backups_get_increasing_unique_names(tmp_path):
+    """Backups never overwrite an earlier one, including pre-existing ones."""
+    (tmp_path / "app.yaml").write_text("a: 1\n")
+    (tmp_path / "app-4.kubecuro.backup").write_text("old\n")
+    engine = AuditEngineV2(str(tmp_path), use_cache=False)
+
+    first = engine.audit_and_heal_file("app.yaml", dry_run=False)
+    second = engine.audit_and_heal_file("app.yaml", dry_run=False)
+
+    assert first.backup_created == "app-5.kubecuro.backup"
+    assert second.backup_created == "app-6.kubecuro.backup"
+    assert (tmp_path / "app-5.kubecuro.backup").read_text() == "a: 1\n"
+    assert first.content == "a: 1"
+    assert first.changes == [] and first.backup_warning is None and first.write_error is None
+
+
+def test_reports_skip_content_when_not_kept(tmp_path):
+    """keep_content=False (the CLI's setting) leaves content out, in workers too."""
+    for name in ("a.yaml", "b.yaml"):
+        (tmp_path / name).write_text("name:\tapp\n")
+    engine = AuditEngineV2(str(tmp_path), keep_content=False)
+
+    reports = list(engine.audit_files_parallel(engine.find_manifests(), workers=2))
+
+    assert [r.status for r in reports] == ["STRUCTURE_OK", "STRUCTURE_OK"]
+    assert all(r.content is None and r.changes is None for r in reports)
+
+
+def test_failed_backup_copy_leaves_no_placeholder(tmp_path, monkeypatch):
+    """A backup whose copy fails is reported and its reserved name removed."""
+    (tmp_path / "app.yaml").write_text("a: 1\n")
+    engine = AuditEngineV2(str(tmp_path), use_cache=False)
+
+    def fail_copy(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("kubecuro.core.engine.shutil.copy2", fail_copy)
+    report = engine.audit_and_heal_file("app.yaml", dry_run=False)
+
+    assert report.backup_created is None
+    assert report.backup_warning == "Backup failed: disk full"
+    assert not list(tmp_path.glob("*.kubecuro.backup"))
+
+
+def test_cleanup_backups_walks_the_whole_tree(tmp_path):
+    """Old backups are removed at any depth; recent ones are kept."""
+    deep = tmp_path.joinpath(*"abcdefghijkl")
+    deep.mkdir(parents=True)
+    old = deep / "app.kubecuro.backup"
+    old.write_text("a: 1\n")
+    os.utime(old, (0, 0))
+    recent = tmp_path / "svc.kubecuro.backup"
+    recent.write_text("b: 2\n")
+
+    assert AuditEngineV2(str(tmp_path)).cleanup_backups() == 1
+    assert not old.exists()
+    assert recent.exists()
+
+
+def test_parallel_writes_of_case_twins_use_separate_temp_files(tmp_path):
+    """app.yaml and app.YAML are healed side by side without sharing a temp file."""
+    lower, upper = tmp_path / "app.yaml", tmp_path / "app.YAML"
+    lower.write_text("name:\tlower\n")
+    upper.write_text("name:\tupper\n")
+    if len(list(tmp_path.iterdir())) != 2:
+        pytest.skip("case-insensitive filesystem")
+    # Another writer's in-flight temp under the old fixed name is left alone
+    (tmp_path / "app.kubecuro.tmp").write_text("in flight\n")
+
+    engine = AuditEngineV2(str(tmp_path))
+    reports = list(engine.audit_files_parallel([str(lower), str(upper)], dry_run=False, workers=2))
+
+    assert all(r.written and r.write_error is None for r in reports)
+    assert lower.read_text() == "name: lower"
+    assert upper.read_text() == "name: upper"
+    assert (tmp_path / "app.kubecuro.tmp").read_text() == "in flight\n"
+    assert [p.name for p in tmp_path.glob("*.kubecuro.tmp")] == ["app.kubecuro.tmp"]
@@ -0,0 +1,109 @@
+import asyncio
+from types import SimpleNamespace
+
+from kubecuro.healing import pipeline as pipeline_module
+from kubecuro.healing.pipeline import HealingPipeline
+
+
+def test_heal_files_parallel_matches_serial(tmp_path):
+    """Worker-process healing yields the same per-file results as heal_files."""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"m{i}.yaml"
+        path.write_text(f"kind:Pod\nmetadata:\n  name: app-{i}\n")
+        paths.append(path)
+
+    pipeline = HealingPipeline()
+    serial = dict(zip(paths, pipeline.heal_files(paths)))
+    parallel = dict(pipeline.heal_files_parallel(paths, workers=2))
+
+    assert parallel.keys() == serial.keys()
+    for path, result in parallel.items():
+        assert result["status"] == serial[path]["status"]
+        assert result["content"] == serial[path]["content"]
+
+
+def test_heal_files_threaded_bounds_reads_in_flight(tmp_path):
+    """Reads are refilled through a 2 * max_workers window, never all queued up front."""
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"m{i}.yaml"
+        path.write_text(f"kind: Pod\nmetadata:\n  name: app-{i}\n")
+        paths.append(path)
+
+    pipeline = HealingPipeline()
+    buffered = []
+    read = pipeline._read
+
+    def tracking_read(fp):
+        buffered.append(fp)
+        return read(fp)
+
+    pipeline._read = tracking_read
+    seen = 0
+    for path, result in pipeline.heal_files_threaded(paths, max_workers=2):
+        seen += 1
+        assert result["status"] == "STRUCTURE_OK"
+        # Reads started so far: consumed results + at most the window (+1 refill)
+        assert len(buffered) <= seen + 2 * 2
+    assert seen == len(paths)
+
+
+def _manifests(tmp_path, count):
+    """Writes count clean manifests and returns their paths."""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"m{i}.yaml"
+        path.write_text(f"kind: Pod\nmetadata:\n  name: app-{i}\n")
+        paths.append(path)
+    return paths
+
+
+def test_heal_files_async_falls_back_to_threads_without_aio_uring(tmp_path, monkeypatch):
+    """Without aio_uring the batch runs on threads and keeps input order."""
+    monkeypatch.setattr(pipeline_module, "aio_uring", None)
+    paths = _manifests(tmp_path, 5)
+    pipeline = HealingPipeline()
+
+    results = asyncio.run(pipeline.heal_files_async(paths, max_in_flight=2))
+
+    assert [fp for fp, _ in results] == paths
+    assert [r["content"] for _, r in results] == [r["content"] for r in pipeline.heal_files(paths)]
+
+
+def test_heal_files_async_bounds_open_files_and_checks_size_first(tmp_path, monkeypatch):
+    """io_uring reads are capped at max_in_flight and oversized files are never opened."""
+    opened = []
+    current, peak = [0], [0]
+
+    class FakeFile:
+        def __init__(self, path):
+            self.path = path
+
+        async def __aenter__(self):
+            opened.append(self.path)
+            current[0] += 1
+            peak[0] = max(peak[0], current[0])
+            return self
+
+        async def __aexit__(self, *exc):
+            current[0] -= 1
+
+        async def read(self, size):
+            await asyncio.sleep(0)
+            with open(self.path, "rb") as f:
+                return f.read(size)
+
+    monkeypatch.setattr(pipeline_module, "aio_uring", SimpleNamespace(open=lambda path, mode: FakeFile(path)))
+    monkeypatch.setattr(pipeline_module.sys, "platform", "linux")
+    paths = _manifests(tmp_path, 10)
+    big = tmp_path / "big.yaml"
+    big.write_bytes(b"a: 1\n" * (1024 * 1024 // 5 + 1))
+    pipeline = HealingPipeline(max_size_mb=1)
+
+    results = dict(asyncio.run(pipeline.heal_files_async(paths + [big], max_in_flight=3)))
+
+    assert peak[0] == 3
+    assert str(big) not in opened
+    assert results[big]["status"] == "FILE_TOO_LARGE"
+    assert all(results[fp]["status"] == "STRUCTURE_OK" for fp in paths)
@@ -0,0 +1,69 @@
+import pytest
+from ruamel.yaml.composer import ReusedAnchorWarning
+
+from kubecuro.healing import structurer
+from kubecuro.healing.structurer import KubeStructurer
+
+
+def test_validate_and_roundtrip_reuses_cached_result():
+    """Revalidating identical text is served from the LRU, not re-parsed."""
+    s = KubeStructurer()
+    cache = s._validate_cache
+    doc = "kind: Pod\nmetadata:\n  name: cached\n"
+
+    first = s.validate_and_roundtrip(doc)
+    second = s.validate_and_roundtrip(doc)
+
+    assert first == second == (True, "kind: Pod\nmetadata:\n  name: cached")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_validation_cache_is_per_instance():
+    """A %YAML directive seen by one structurer never leaks into another's results."""
+    s = KubeStructurer()
+    s.process_yaml("%YAML 1.2\n---\na: 1\n")
+    s.process_yaml("b: 1\n")
+
+    assert KubeStructurer().process_yaml("b: 1\n") == ("b: 1", "STRUCTURE_OK")
+
+
+def test_structure_error_keeps_location_and_string_format():
+    """Failed validation carries the 0-based line and renders the legacy string."""
+    s = KubeStructurer()
+    valid, err = s.validate_and_roundtrip("a: 1\nb:\n  c: 2\n   d: 3\n")
+
+    assert valid is False
+    assert isinstance(err, structurer.StructureError)
+    assert s._extract_line(err) == s._extract_line(str(err)) == err.line
+    assert str(err).startswith(f"STRUCTURE_ERROR:L{err.line + 1}:C{err.column + 1}:")
+
+
+def test_third_attempt_is_judged_by_ruamel_alone():
+    """Input ruamel accepts but PyYAML rejects (a reused anchor) still heals on attempt 3."""
+    broken = "a: &x 1\nb: &x 2\nspec:\n  c: 1\n   d: 2\n   e: 3\n    f: 4\n"
+
+    # ruamel only warns about the reused anchor
+    with pytest.warns(ReusedAnchorWarning):
+        healed, status = KubeStructurer().process_yaml(broken)
+
+    assert status == "STRUCTURE_FIXED_3"
+    assert healed == "a: &x 1\nb: &x 2\nspec:\n  c: 1\n  d: 2\n  e: 3\n  f: 4"
+
+
+def test_process_yaml_stream_matches_process_yaml():
+    """Chunked CRLF input, clean or broken, heals exactly like the string API."""
+    import io
+
+    class OneCharReader(io.StringIO):
+        def read(self, size=-1):
+            return super().read(1)
+
+    class Unseekable(OneCharReader):
+        def seekable(self):
+            return False
+
+    s = KubeStructurer()
+    for text in ("kind: Pod\r\nmetadata:\r\n  name: x\r\n", "x:\r\n  y: 1\r\n   z: 2\r\n",
+                 "a: |\n  x\n\n", "---\na: 1\n---\nb: 2\n"):
+        for reader in (OneCharReader, Unseekable):
+            assert s.process_yaml_stream(reader(text)) == s.process_yaml(text)